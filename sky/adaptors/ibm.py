@@ -8,6 +8,15 @@ import os
 import json
 import requests
 import functools
+import threading
+from typing import Any, Dict, Tuple
+
+try:
+    # Use the libyaml-backed loader when available, as it is considerably
+    # faster than the pure-Python one.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
 CREDENTIAL_FILE = '~/.ibm/credentials.yaml'
 logger = sky_logging.init_logger(__name__)
@@ -39,15 +48,59 @@ def import_package(func):
     return wrapper
 
 
+# Cache of the IAM authenticator and SDK clients, keyed by the creating
+# function, the API key and the function's arguments. Including the API key
+# means that a changed credentials file yields new objects rather than ones
+# bound to the old key. Unlike lru_cache(), creation happens while holding
+# `_cache_lock`, so concurrent callers asking for the same object (e.g., on
+# first use from several threads) share a single creation instead of each
+# building their own authenticator and fetching their own IAM token.
+# The lock is reentrant as clients get their authenticator from the cache.
+_cache: Dict[Tuple[str, str, Tuple[Any, ...], Tuple[Any, ...]], Any] = {}
+_cache_lock = threading.RLock()
+
+
+def _coalesced_cache(func):
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, get_api_key(), args,
+               tuple(sorted(kwargs.items())))
+        with _cache_lock:
+            if key not in _cache:
+                # Exceptions are not cached, so a failed creation is retried
+                # on the next call.
+                _cache[key] = func(*args, **kwargs)
+            return _cache[key]
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=1)
+def _load_credential_file(path: str, mtime_ns: int):
+    del mtime_ns  # Only used as part of the cache key.
+    with open(path, encoding='utf-8') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def read_credential_file():
-    with open(os.path.expanduser(CREDENTIAL_FILE), encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    """Returns the parsed content of the IBM credentials file.
+
+    The parsed content is cached, keyed on the file's modification time, so
+    that repeated lookups do not re-read and re-parse the file unless it has
+    been modified.
+    """
+    path = os.path.expanduser(CREDENTIAL_FILE)
+    return _load_credential_file(path, os.stat(path).st_mtime_ns)
 
 
 def get_api_key():
     return read_credential_file()['iam_api_key']
 
 
+# Cached, so that all clients share one authenticator (and thus one IAM
+# token).
+@_coalesced_cache
 @import_package
 def _get_authenticator():
     return ibm_cloud_sdk_core.authenticators.IAMAuthenticator(get_api_key())
@@ -68,12 +121,17 @@ def get_oauth_token():
     return json.loads(res.text)['access_token']
 
 
+# Clients are cached per set of arguments (i.e., per region), so that the
+# underlying HTTP connection pool and IAM token are reused across calls
+# instead of being re-created for every IBM operation.
+@_coalesced_cache
 @import_package
 def client(**kwargs):
     """Create an ibm vpc client.
 
     Sets the vpc client to a specific region.
     If none was specified 'us-south' is set internally.
+    The client is cached, and the same object is returned for the same region.
 
     Args:
         kwargs: Keyword arguments.
@@ -95,12 +153,14 @@ def client(**kwargs):
     return vpc_client  # returns either formerly or newly created client
 
 
+@_coalesced_cache
 @import_package
 def search_client():
     return ibm_platform_services.GlobalSearchV2(
         authenticator=_get_authenticator())
 
 
+@_coalesced_cache
 @import_package
 def tagging_client():
     return ibm_platform_services.GlobalTaggingV1(
@@ -7,13 +7,24 @@ TODO:
 * Better interface.
 * Better implementation (e.g., fsspec, smart_open, using each cloud's SDK).
 """
+import os
+import shutil
 import subprocess
-import urllib.parse
 
 from sky.clouds import gcp
 from sky.data import data_utils
 from sky.adaptors import aws, cloudflare
 
+# Marker file recording that the AWS CLI is available on the machine. The
+# installation check (`aws --version` starts a Python interpreter) is then
+# done once per machine instead of once per generated sync command.
+_AWSCLI_INSTALLED_MARKER = '~/.sky/.awscli_installed'
+_GET_AWSCLI_ONCE = (
+    f'test -f {_AWSCLI_INSTALLED_MARKER} || '
+    '{ { aws --version >/dev/null 2>&1 || pip3 install awscli; } && '
+    'mkdir -p ~/.sky && '
+    f'touch {_AWSCLI_INSTALLED_MARKER}; }}')
+
 
 class CloudStorage:
     """Interface for a cloud object store."""
@@ -39,8 +50,32 @@ class S3CloudStorage(CloudStorage):
     """AWS Cloud Storage."""
 
     # List of commands to install AWS CLI
-    _GET_AWSCLI = [
-        'aws --version >/dev/null 2>&1 || pip3 install awscli',
+    _GET_AWSCLI = [_GET_AWSCLI_ONCE]
+
+    # AWS CLI transfer settings used for downloads. By default, the CLI only
+    # uses 10 concurrent requests and 8MB parts, which leaves a single large
+    # file or many small files bound by the CLI itself rather than the
+    # network.
+    # NOTE: these are written to the `default` profile of the AWS config file
+    # on the machine running the command (~/.aws/config), and each setting is
+    # only written if the user has not configured it already. As every
+    # `aws configure` call starts a Python interpreter, this is done once per
+    # machine (guarded by a marker file) rather than for every command.
+    # Failing to apply a setting does not prevent the download, and leaves
+    # the marker file unset so that the settings are retried next time.
+    _AWSCLI_S3_SETTINGS = {
+        'max_concurrent_requests': '32',
+        'multipart_threshold': '64MB',
+        'multipart_chunksize': '64MB',
+    }
+    _AWSCLI_CONFIGURED_MARKER = '~/.sky/.awscli_s3_configured'
+    _CONFIGURE_AWSCLI = [
+        f'{{ test -f {_AWSCLI_CONFIGURED_MARKER} || {{ {{ ' +
+        ' && '.join(f'{{ aws configure get default.s3.{key} >/dev/null 2>&1 || '
+                    f'aws configure set default.s3.{key} {value}; }}'
+                    for key, value in _AWSCLI_S3_SETTINGS.items()) +
+        f'; }} && mkdir -p ~/.sky && touch {_AWSCLI_CONFIGURED_MARKER}; }} '
+        '|| true; }'
     ]
 
     def is_directory(self, url: str) -> bool:
@@ -51,37 +86,42 @@ class S3CloudStorage(CloudStorage):
         """
         s3 = aws.resource('s3')
         bucket_name, path = data_utils.split_s3_path(url)
-        bucket = s3.Bucket(bucket_name)
 
-        num_objects = 0
-        for obj in bucket.objects.filter(Prefix=path):
-            num_objects += 1
-            if obj.key == path:
-                return False
-            # If there are more than 1 object in filter, then it is a directory
-            if num_objects == 3:
-                return True
+        # Objects are listed in lexicographical order, so if an object named
+        # exactly `path` exists, it is the first one under the prefix. Thus a
+        # single, one-key listing request is enough to tell the two apart.
+        response = s3.meta.client.list_objects_v2(Bucket=bucket_name,
+                                                  Prefix=path,
+                                                  MaxKeys=1)
+        objects = response.get('Contents', [])
+        if objects and objects[0]['Key'] == path:
+            return False
 
         # A directory with few or no items
         return True
 
     def make_sync_dir_command(self, source: str, destination: str) -> str:
         """Downloads using AWS CLI."""
-        # AWS Sync by default uses 10 threads to upload files to the bucket.
-        # To increase parallelism, modify max_concurrent_requests in your
-        # aws config file (Default path: ~/.aws/config).
+        # AWS Sync by default uses 10 threads to download files from the
+        # bucket. We raise it (see _AWSCLI_S3_SETTINGS) unless the user has
+        # set max_concurrent_requests in the aws config file (Default path:
+        # ~/.aws/config).
         download_via_awscli = ('aws s3 sync --no-follow-symlinks '
                                f'{source} {destination}')
 
         all_commands = list(self._GET_AWSCLI)
+        all_commands.extend(self._CONFIGURE_AWSCLI)
         all_commands.append(download_via_awscli)
         return ' && '.join(all_commands)
 
     def make_sync_file_command(self, source: str, destination: str) -> str:
         """Downloads a file using AWS CLI."""
+        # Large files are downloaded as concurrent ranged GETs of
+        # multipart_chunksize each, bounded by max_concurrent_requests.
         download_via_awscli = f'aws s3 cp {source} {destination}'
 
         all_commands = list(self._GET_AWSCLI)
+        all_commands.extend(self._CONFIGURE_AWSCLI)
         all_commands.append(download_via_awscli)
         return ' && '.join(all_commands)
 
@@ -104,14 +144,29 @@ class GcsCloudStorage(CloudStorage):
         In cloud object stores, a "directory" refers to a regular object whose
         name is a prefix of other objects.
         """
-        commands = [self._GET_GSUTIL]
-        commands.append(f'{self._GSUTIL} ls -d {url}')
-        command = ' && '.join(commands)
-        p = subprocess.run(command,
-                           stdout=subprocess.PIPE,
-                           shell=True,
-                           check=True,
-                           executable='/bin/bash')
+        if (shutil.which('gcloud') is not None and
+                shutil.which('gsutil') is not None):
+            # Fast path: the Cloud SDK is already installed, so run gsutil
+            # directly instead of spawning a bash process for the
+            # installation check. Still restore the gcloud config as the
+            # installation command does.
+            gcp.restore_gcloud_config_from_backup()
+            env = os.environ.copy()
+            env['GOOGLE_APPLICATION_CREDENTIALS'] = (
+                gcp.DEFAULT_GCP_APPLICATION_CREDENTIAL_PATH)
+            p = subprocess.run(['gsutil', 'ls', '-d', url],
+                               stdout=subprocess.PIPE,
+                               check=True,
+                               env=env)
+        else:
+            commands = [self._GET_GSUTIL]
+            commands.append(f'{self._GSUTIL} ls -d {url}')
+            command = ' && '.join(commands)
+            p = subprocess.run(command,
+                               stdout=subprocess.PIPE,
+                               shell=True,
+                               check=True,
+                               executable='/bin/bash')
         out = p.stdout.decode().strip()
         # Edge Case: Gcloud command is run for first time #437
         out = out.split('\n')[-1]
@@ -150,9 +205,7 @@ class R2CloudStorage(CloudStorage):
     """Cloudflare Cloud Storage."""
 
     # List of commands to install AWS CLI
-    _GET_AWSCLI = [
-        'aws --version >/dev/null 2>&1 || pip3 install awscli',
-    ]
+    _GET_AWSCLI = [_GET_AWSCLI_ONCE]
 
     def is_directory(self, url: str) -> bool:
         """Returns whether R2 'url' is a directory.
@@ -162,16 +215,16 @@ class R2CloudStorage(CloudStorage):
         """
         r2 = cloudflare.resource('s3')
         bucket_name, path = data_utils.split_r2_path(url)
-        bucket = r2.Bucket(bucket_name)
 
-        num_objects = 0
-        for obj in bucket.objects.filter(Prefix=path):
-            num_objects += 1
-            if obj.key == path:
-                return False
-            # If there are more than 1 object in filter, then it is a directory
-            if num_objects == 3:
-                return True
+        # Objects are listed in lexicographical order, so if an object named
+        # exactly `path` exists, it is the first one under the prefix. Thus a
+        # single, one-key listing request is enough to tell the two apart.
+        response = r2.meta.client.list_objects_v2(Bucket=bucket_name,
+                                                  Prefix=path,
+                                                  MaxKeys=1)
+        objects = response.get('Contents', [])
+        if objects and objects[0]['Key'] == path:
+            return False
 
         # A directory with few or no items
         return True
@@ -207,12 +260,15 @@ class R2CloudStorage(CloudStorage):
 
 def get_storage_from_path(url: str) -> CloudStorage:
     """Returns a CloudStorage by identifying the scheme:// in a URL."""
-    result = urllib.parse.urlsplit(url)
-
-    if result.scheme not in _REGISTRY:
-        assert False, (f'Scheme {result.scheme} not found in'
-                       f' supported storage ({_REGISTRY.keys()}); path {url}')
-    return _REGISTRY[result.scheme]
+    scheme, sep, _ = url.partition('://')
+    # Like urllib.parse.urlsplit(), treat the scheme as case-insensitive and
+    # as empty for paths without one.
+    scheme = scheme.lower() if sep else ''
+    storage = _REGISTRY.get(scheme)
+    if storage is None:
+        raise ValueError(f'Scheme {scheme} not found in'
+                         f' supported storage ({_REGISTRY.keys()}); path {url}')
+    return storage
 
 
 _REGISTRY = {
@@ -2,6 +2,7 @@
 import functools
 import json
 import os
+import shutil
 import subprocess
 import time
 import typing
@@ -49,6 +50,14 @@ _CREDENTIAL_FILES = [
     'active_config',
 ]
 
+# Restores the gcloud config from SkyPilot's backup, as the config under the
+# gcloud config directory can be overwritten (e.g., by ray autoscaler on the
+# remote nodes). Failures are ignored. Keep it in sync with
+# restore_gcloud_config_from_backup(), its counterpart for use from Python.
+GCLOUD_CONFIG_RESTORE_COMMAND = (
+    f'{{ cp {GCP_CONFIG_SKY_BACKUP_PATH} {GCP_CONFIG_PATH} > /dev/null 2>&1 '
+    '|| true; }')
+
 _GCLOUD_INSTALLATION_LOG = '~/.sky/logs/gcloud_installation.log'
 _GCLOUD_VERSION = '424.0.0'
 # Need to be run with /bin/bash
@@ -64,9 +73,19 @@ GCLOUD_INSTALLATION_COMMAND = f'pushd /tmp &>/dev/null && \
     ~/google-cloud-sdk/install.sh -q >> {_GCLOUD_INSTALLATION_LOG} 2>&1 && \
     echo "source ~/google-cloud-sdk/path.bash.inc > /dev/null 2>&1" >> ~/.bashrc && \
     source ~/google-cloud-sdk/path.bash.inc >> {_GCLOUD_INSTALLATION_LOG} 2>&1; }} && \
-    {{ cp {GCP_CONFIG_SKY_BACKUP_PATH} {GCP_CONFIG_PATH} > /dev/null 2>&1 || true; }} && \
+    {GCLOUD_CONFIG_RESTORE_COMMAND} && \
     popd &>/dev/null'
 
+
+def restore_gcloud_config_from_backup() -> None:
+    """Same as GCLOUD_CONFIG_RESTORE_COMMAND, without spawning a shell."""
+    try:
+        shutil.copyfile(os.path.expanduser(GCP_CONFIG_SKY_BACKUP_PATH),
+                        os.path.expanduser(GCP_CONFIG_PATH))
+    except OSError:
+        pass
+
+
 # TODO(zhwu): Move the default AMI size to the catalog instead.
 DEFAULT_GCP_IMAGE_GB = 50
 
@@ -1,7 +1,9 @@
 """Common utilities for service catalog."""
 import ast
 import hashlib
+import io
 import os
+import pickle
 import time
 from typing import Dict, List, NamedTuple, Optional, Tuple
 
@@ -22,6 +24,10 @@ _CATALOG_DIR = os.path.join(constants.LOCAL_CATALOG_DIR,
                             constants.CATALOG_SCHEMA_VERSION)
 os.makedirs(_CATALOG_DIR, exist_ok=True)
 
+# Version of the format of the parsed catalog files written by
+# _read_csv_with_parsed_cache(). Bump it when that format changes.
+_PARSED_CATALOG_FORMAT_VERSION = 1
+
 
 class InstanceTypeInfo(NamedTuple):
     """Instance type information.
@@ -54,8 +60,43 @@ def get_catalog_path(filename: str) -> str:
     return os.path.join(_CATALOG_DIR, filename)
 
 
+def _read_csv_with_parsed_cache(catalog_path: str,
+                                parsed_path: str) -> pd.DataFrame:
+    """Reads a catalog CSV file, caching the parsed dataframe.
+
+    The parsed dataframe is pickled to `parsed_path`, together with the md5
+    of the CSV content, the cache format version and the pandas version. It is
+    only reused if all of them match exactly; otherwise (or if the file is
+    missing or corrupted) the CSV is parsed again and the cache is rewritten.
+    The caller must hold the catalog's file lock.
+    """
+    with open(catalog_path, 'rb') as f:
+        content = f.read()
+    cache_key = (_PARSED_CATALOG_FORMAT_VERSION, pd.__version__,
+                 hashlib.md5(content).hexdigest())
+    try:
+        with open(parsed_path, 'rb') as f:
+            cached_key, df = pickle.load(f)
+        if cached_key == cache_key:
+            return df
+    except Exception:  # pylint: disable=broad-except
+        # Missing, corrupted or incompatible file: parse the CSV instead.
+        pass
+
+    df = pd.read_csv(io.BytesIO(content))
+    try:
+        tmp_path = f'{parsed_path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((cache_key, df), f)
+        os.replace(tmp_path, parsed_path)
+    except OSError as e:
+        logger.debug(f'Failed to write the parsed catalog {parsed_path}: {e}')
+    return df
+
+
 def read_catalog(filename: str,
-                 pull_frequency_hours: Optional[int] = None) -> pd.DataFrame:
+                 pull_frequency_hours: Optional[int] = None,
+                 use_parsed_cache: bool = False) -> pd.DataFrame:
     """Reads the catalog from a local CSV file.
 
     If the file does not exist, download the up-to-date catalog that matches
@@ -64,6 +105,9 @@ def read_catalog(filename: str,
     possibly updated prices, if the local catalog file is older than
     `pull_frequency_hours` and no changes to the local catalog file are
     made after the last pull.
+    If `use_parsed_cache` is True: keep a binary copy of the parsed catalog,
+    and load it instead of parsing the CSV file while the CSV file content is
+    unchanged.
     """
     assert filename.endswith('.csv'), 'The catalog file must be a CSV file.'
     assert (pull_frequency_hours is None or
@@ -135,7 +179,13 @@ def read_catalog(filename: str,
                         f.write(hashlib.md5(r.text.encode()).hexdigest())
 
     try:
-        df = pd.read_csv(catalog_path)
+        if use_parsed_cache:
+            # pylint: disable=abstract-class-instantiated
+            with filelock.FileLock(meta_path + '.lock'):
+                df = _read_csv_with_parsed_cache(catalog_path,
+                                                 meta_path + '.parsed.pkl')
+        else:
+            df = pd.read_csv(catalog_path)
     except Exception as e:  # pylint: disable=broad-except
         # As users can manually modify the catalog, read_csv can fail.
         logger.error(f'Failed to read {catalog_path}. '
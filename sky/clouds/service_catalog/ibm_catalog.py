@@ -5,6 +5,10 @@ This module loads the service catalog file and can be used to query
 instance types and pricing information for IBM.
 """
 
+import functools
+
+import pandas as pd
+
 from sky import sky_logging
 from sky.clouds import cloud
 from sky.clouds.service_catalog import common
@@ -17,41 +21,70 @@ _DEFAULT_INSTANCE_FAMILY = 'bx2'
 _DEFAULT_NUM_VCPUS = '8'
 _DEFAULT_MEMORY = 32
 
-_df = common.read_catalog('ibm/vms.csv')
+
+# The catalog is loaded on first use rather than at import time, so that
+# importing this module (e.g., to validate an image tag) does not pay for
+# reading and parsing the CSV.
+@functools.lru_cache(maxsize=1)
+def _get_df() -> pd.DataFrame:
+    df = common.read_catalog('ibm/vms.csv', use_parsed_cache=True)
+    # Store the zone names, which repeat for every instance type, as a
+    # categorical column: equality filters on it then compare integer codes
+    # instead of Python strings. Other string columns are kept as is, as the
+    # shared catalog helpers group by them or aggregate them with min(),
+    # which unordered categoricals do not support as-is.
+    df['AvailabilityZone'] = df['AvailabilityZone'].astype('category')
+    return df
+
+
+# The catalog is not modified after loading, so the sub-tables used by the
+# per-instance-type and default-instance-type queries are computed once
+# instead of re-scanning the whole catalog on every call.
+@functools.lru_cache(maxsize=1)
+def _get_df_by_instance_type() -> Dict[str, pd.DataFrame]:
+    return dict(iter(_get_df().groupby('InstanceType')))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_family_df() -> pd.DataFrame:
+    df = _get_df()
+    return df[df['InstanceType'].str.startswith(f'{_DEFAULT_INSTANCE_FAMILY}-')]
 
 
 def instance_type_exists(instance_type: str) -> bool:
-    return common.instance_type_exists_impl(_df, instance_type)
+    return common.instance_type_exists_impl(_get_df(), instance_type)
 
 
 def validate_region_zone(region: Optional[str], zone: Optional[str]):
-    return common.validate_region_zone_impl('IBM', _df, region, zone)
+    return common.validate_region_zone_impl('IBM', _get_df(), region, zone)
 
 
 def accelerator_in_region_or_zone(acc_name: str,
                                   acc_count: int,
                                   region: Optional[str] = None,
                                   zone: Optional[str] = None) -> bool:
-    return common.accelerator_in_region_or_zone_impl(_df, acc_name, acc_count,
-                                                     region, zone)
+    return common.accelerator_in_region_or_zone_impl(_get_df(), acc_name,
+                                                     acc_count, region, zone)
 
 
 def get_hourly_cost(instance_type: str,
                     use_spot: bool = False,
                     region: Optional[str] = None,
                     zone: Optional[str] = None) -> float:
-    return common.get_hourly_cost_impl(_df, instance_type, use_spot, region,
-                                       zone)
+    return common.get_hourly_cost_impl(_get_df(), instance_type, use_spot,
+                                       region, zone)
 
 
 def get_vcpus_mem_from_instance_type(
         instance_type: str) -> Tuple[Optional[float], Optional[float]]:
-    return common.get_vcpus_mem_from_instance_type_impl(_df, instance_type)
+    return common.get_vcpus_mem_from_instance_type_impl(_get_df(),
+                                                        instance_type)
 
 
 def get_accelerators_from_instance_type(
         instance_type: str) -> Optional[Dict[str, int]]:
-    return common.get_accelerators_from_instance_type_impl(_df, instance_type)
+    return common.get_accelerators_from_instance_type_impl(
+        _get_df(), instance_type)
 
 
 def get_instance_type_for_accelerator(
@@ -67,7 +100,7 @@ def get_instance_type_for_accelerator(
     Returns a list of instance types satisfying the required count of
     accelerators with sorted prices and a list of candidates with fuzzy search.
     """
-    return common.get_instance_type_for_accelerator_impl(df=_df,
+    return common.get_instance_type_for_accelerator_impl(df=_get_df(),
                                                          acc_name=acc_name,
                                                          acc_count=acc_count,
                                                          cpus=cpus,
@@ -79,7 +112,9 @@ def get_instance_type_for_accelerator(
 
 def get_region_zones_for_instance_type(instance_type: str,
                                        use_spot: bool) -> List[cloud.Region]:
-    df = _df[_df['InstanceType'] == instance_type]
+    df = _get_df_by_instance_type().get(instance_type)
+    if df is None:
+        df = _get_df().iloc[:0]
     return common.get_region_zones(df, use_spot)
 
 
@@ -90,8 +125,9 @@ def list_accelerators(
         case_sensitive: bool = True
 ) -> Dict[str, List[common.InstanceTypeInfo]]:
     """Returns all instance types in IBM offering accelerators."""
-    return common.list_accelerators_impl('IBM', _df, gpus_only, name_filter,
-                                         region_filter, case_sensitive)
+    return common.list_accelerators_impl('IBM', _get_df(), gpus_only,
+                                         name_filter, region_filter,
+                                         case_sensitive)
 
 
 def get_default_instance_type(cpus: Optional[str] = None,
@@ -105,10 +141,8 @@ def get_default_instance_type(cpus: Optional[str] = None,
         memory_gb_or_ratio = f'{_DEFAULT_MEMORY}+'
     else:
         memory_gb_or_ratio = memory
-    instance_type_prefix = f'{_DEFAULT_INSTANCE_FAMILY}-'
-    df = _df[_df['InstanceType'].str.startswith(instance_type_prefix)]
-    return common.get_instance_type_for_cpus_mem_impl(df, cpus,
-                                                      memory_gb_or_ratio)
+    return common.get_instance_type_for_cpus_mem_impl(_get_default_family_df(),
+                                                      cpus, memory_gb_or_ratio)
 
 
 def is_image_tag_valid(tag: str, region: Optional[str]) -> bool:
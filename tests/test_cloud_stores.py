@@ -0,0 +1,57 @@
+import types
+from typing import List
+
+import pytest
+
+from sky import cloud_stores
+
+
+def _fake_resource(keys: List[str]):
+    """Returns a fake boto3 S3 resource whose bucket contains `keys`."""
+
+    def list_objects_v2(Bucket, Prefix, MaxKeys):
+        del Bucket  # unused
+        # S3 (and R2) list keys in lexicographical order.
+        matches = sorted(key for key in keys if key.startswith(Prefix))
+        contents = [{'Key': key} for key in matches[:MaxKeys]]
+        response = {'KeyCount': len(contents)}
+        if contents:
+            response['Contents'] = contents
+        return response
+
+    client = types.SimpleNamespace(list_objects_v2=list_objects_v2)
+    return types.SimpleNamespace(meta=types.SimpleNamespace(client=client))
+
+
+@pytest.mark.parametrize('keys,url,expected', [
+    ([], 'bucket/data', True),
+    (['data', 'data/file.txt', 'data0'], 'bucket/data', False),
+    (['dir/', 'dir/file.txt'], 'bucket/dir/', False),
+    (['data/a.txt', 'data/b.txt', 'data0'], 'bucket/data', True),
+])
+def test_s3_compatible_is_directory(monkeypatch, keys, url, expected):
+    monkeypatch.setattr(cloud_stores.aws, 'resource',
+                        lambda _: _fake_resource(keys))
+    monkeypatch.setattr(cloud_stores.cloudflare, 'resource',
+                        lambda _: _fake_resource(keys))
+    assert cloud_stores.S3CloudStorage().is_directory(f's3://{url}') is expected
+    assert cloud_stores.R2CloudStorage().is_directory(f'r2://{url}') is expected
+
+
+def test_get_storage_from_path():
+    assert isinstance(cloud_stores.get_storage_from_path('s3://bucket/key'),
+                      cloud_stores.S3CloudStorage)
+    # The scheme is case-insensitive.
+    assert isinstance(cloud_stores.get_storage_from_path('S3://bucket/key'),
+                      cloud_stores.S3CloudStorage)
+
+
+def test_get_storage_from_path_unknown_scheme():
+    with pytest.raises(ValueError, match='Scheme abc not found'):
+        cloud_stores.get_storage_from_path('abc://bucket/key')
+
+
+def test_get_storage_from_path_local_path():
+    # A path without a scheme reports an empty scheme, not the whole path.
+    with pytest.raises(ValueError, match='Scheme  not found'):
+        cloud_stores.get_storage_from_path('/local/path')
@@ -0,0 +1,99 @@
+import os
+import textwrap
+import threading
+import time
+import types
+
+import pytest
+
+from sky.adaptors import ibm
+
+
+def _write_credential_file(path, api_key: str, mtime_ns: int) -> None:
+    path.write_text(
+        textwrap.dedent(f"""\
+            iam_api_key: {api_key}
+            resource_group_id: rg-12345678
+            """))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def credential_file(monkeypatch, tmp_path):
+    path = tmp_path / 'credentials.yaml'
+    _write_credential_file(path, 'key-1', mtime_ns=1_000_000_000)
+    monkeypatch.setattr(ibm, 'CREDENTIAL_FILE', str(path))
+    monkeypatch.setattr(ibm, '_cache', {})
+    ibm._load_credential_file.cache_clear()
+    yield path
+    ibm._load_credential_file.cache_clear()
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    """Replaces the IBM SDKs with fakes that count client creations."""
+    created = []
+
+    class FakeVpcV1:
+
+        def __init__(self, version, authenticator):
+            del version  # unused
+            # Widen the window in which concurrent callers could race.
+            time.sleep(0.1)
+            self.authenticator = authenticator
+            created.append(self)
+
+        def set_service_url(self, url):
+            self.service_url = url
+
+    class FakeIAMAuthenticator:
+
+        def __init__(self, api_key):
+            self.api_key = api_key
+
+    monkeypatch.setattr(ibm, 'ibm_vpc', types.SimpleNamespace(VpcV1=FakeVpcV1))
+    monkeypatch.setattr(
+        ibm, 'ibm_cloud_sdk_core',
+        types.SimpleNamespace(authenticators=types.SimpleNamespace(
+            IAMAuthenticator=FakeIAMAuthenticator)))
+    monkeypatch.setattr(ibm, 'ibm_platform_services', types.SimpleNamespace())
+    return created
+
+
+def test_read_credential_file_reparses_on_mtime_change(credential_file):
+    assert ibm.get_api_key() == 'key-1'
+    assert ibm._load_credential_file.cache_info().misses == 1
+    assert ibm.get_api_key() == 'key-1'
+    assert ibm._load_credential_file.cache_info().misses == 1
+
+    _write_credential_file(credential_file, 'key-2', mtime_ns=2_000_000_000)
+    assert ibm.get_api_key() == 'key-2'
+    assert ibm._load_credential_file.cache_info().misses == 2
+
+
+def test_concurrent_client_calls_share_one_client(credential_file, fake_sdk):
+    clients = []
+
+    def get_client():
+        clients.append(ibm.client(region='us-south'))
+
+    threads = [threading.Thread(target=get_client) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fake_sdk) == 1
+    assert clients[0] is clients[1]
+    assert ibm.client(region='us-south') is clients[0]
+    assert ibm.client(region='us-east') is not clients[0]
+
+
+def test_client_is_recreated_on_api_key_change(credential_file, fake_sdk):
+    old_client = ibm.client(region='us-south')
+    assert old_client.authenticator.api_key == 'key-1'
+
+    _write_credential_file(credential_file, 'key-2', mtime_ns=2_000_000_000)
+    new_client = ibm.client(region='us-south')
+    assert new_client is not old_client
+    assert new_client.authenticator.api_key == 'key-2'
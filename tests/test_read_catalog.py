@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+import pytest
+
+from sky.clouds.service_catalog import common
+
+_CATALOG = 'ibm/vms.csv'
+
+
+def _write_catalog(path, instance_type: str) -> None:
+    path.write_text('InstanceType,vCPUs,Price\n'
+                    f'{instance_type},8,0.5\n')
+    # Keep the same mtime across rewrites, as `cp -p` or `rsync -a` would.
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+
+@pytest.fixture
+def catalog_path(monkeypatch, tmp_path):
+    monkeypatch.setattr(common, '_CATALOG_DIR', str(tmp_path))
+    path = tmp_path / _CATALOG
+    path.parent.mkdir()
+    _write_catalog(path, 'bx2-8x32')
+    return path
+
+
+def _parsed_cache_path(tmp_path) -> str:
+    return os.path.join(tmp_path, '.meta', _CATALOG + '.parsed.pkl')
+
+
+def test_parsed_cache_is_reused(monkeypatch, catalog_path):
+    df = common.read_catalog(_CATALOG, use_parsed_cache=True)
+    assert df['InstanceType'].tolist() == ['bx2-8x32']
+    assert os.path.exists(_parsed_cache_path(catalog_path.parent.parent))
+
+    def _fail_read_csv(*args, **kwargs):
+        raise AssertionError('The CSV should not be parsed again.')
+
+    monkeypatch.setattr(pd, 'read_csv', _fail_read_csv)
+    df = common.read_catalog(_CATALOG, use_parsed_cache=True)
+    assert df['InstanceType'].tolist() == ['bx2-8x32']
+
+
+def test_parsed_cache_ignored_when_csv_replaced(catalog_path):
+    common.read_catalog(_CATALOG, use_parsed_cache=True)
+    # Same size and mtime, different content.
+    _write_catalog(catalog_path, 'cx2-8x16')
+    df = common.read_catalog(_CATALOG, use_parsed_cache=True)
+    assert df['InstanceType'].tolist() == ['cx2-8x16']
+
+
+def test_corrupted_parsed_cache_falls_back_to_csv(catalog_path):
+    common.read_catalog(_CATALOG, use_parsed_cache=True)
+    parsed_path = _parsed_cache_path(catalog_path.parent.parent)
+    with open(parsed_path, 'wb') as f:
+        f.write(b'not a pickle')
+    df = common.read_catalog(_CATALOG, use_parsed_cache=True)
+    assert df['InstanceType'].tolist() == ['bx2-8x32']
+    # The cache is rewritten with a valid copy.
+    assert pd.read_pickle(parsed_path)[1].equals(df)